@@ -1,14 +1,55 @@
 """FastAPI application entrypoint."""
 
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 
 from backend.routers import get_api_router
+from backend.services.cache import close_cache
+from backend.services.db import close_db
+from backend.services.llm import RAASLLMClient
 from backend.utils.config import get_settings
+from calendar_service.cal_adapter import CalComAdapter
 
 
 settings = get_settings()
 
-app = FastAPI(title=settings.app_name, version=settings.app_version)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Create per-worker integration clients and release pools on exit."""
+
+    app.state.llm = RAASLLMClient(
+        api_key=settings.openai_api_key,
+        model=settings.openai_model,
+        temperature=settings.openai_temperature,
+        use_stub=settings.openai_use_stub,
+    )
+    app.state.cal = CalComAdapter(
+        api_key=settings.cal_api_key,
+        event_type_id=settings.cal_event_type_id,
+        calendar_id=settings.cal_calendar_id,
+        timezone=settings.cal_timezone,
+        use_stub=settings.cal_use_stub,
+    )
+    app.state.llm.open()
+    app.state.cal.open()
+    try:
+        yield
+    finally:
+        await app.state.llm.aclose()
+        await app.state.cal.aclose()
+        await close_cache()
+        await close_db()
+
+
+app = FastAPI(
+    title=settings.app_name,
+    version=settings.app_version,
+    lifespan=lifespan,
+)
 app.include_router(get_api_router())
 
 
@@ -24,3 +65,15 @@ def version() -> dict[str, str]:
     """Return application version metadata."""
 
     return {"version": settings.app_version}
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(
+        "backend.main:app",
+        loop="uvloop",
+        http="httptools",
+        workers=(os.cpu_count() or 1) * 2 + 1,
+        backlog=2048,
+    )
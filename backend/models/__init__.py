@@ -1,3 +1,5 @@
 """Database models package."""
 
-from backend.models.appointment import Appointment  # noqa: F401
+from backend.models.appointment import Appointment, AppointmentStatus  # noqa: F401
+from backend.models.dentist import Dentist  # noqa: F401
+from backend.models.patient import Patient  # noqa: F401
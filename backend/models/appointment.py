@@ -2,10 +2,21 @@
 
 from __future__ import annotations
 
+import enum
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import DateTime, ForeignKey, String, Text
+from sqlalchemy import (
+    DateTime,
+    Enum as SAEnum,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+    UniqueConstraint,
+    func,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from backend.models.base import Base
@@ -18,10 +29,31 @@ else:  # pragma: no cover - typing runtime fallback
     Patient = "Patient"  # type: ignore[assignment]
 
 
+class AppointmentStatus(str, enum.Enum):
+    """Lifecycle states stored in the ``appointment_status`` enum type."""
+
+    PENDING = "PENDING"
+    CONFIRMED = "CONFIRMED"
+    CANCELLED = "CANCELLED"
+    COMPLETED = "COMPLETED"
+
+
 class Appointment(Base):
     """Represents a dentist appointment booking."""
 
     __tablename__ = "appointments"
+    __table_args__ = (
+        Index("ix_appt_dentist_start", "dentist_id", "start_time"),
+        Index("ix_appt_patient_start", "patient_id", "start_time"),
+        Index("ix_appt_status_start", "status", "start_time"),
+        Index(
+            "ix_appt_active",
+            "dentist_id",
+            "start_time",
+            postgresql_where=text("status IN ('PENDING', 'CONFIRMED')"),
+        ),
+        UniqueConstraint("calcom_booking_id", name="uq_appt_calcom_booking_id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     patient_id: Mapped[int] = mapped_column(
@@ -44,24 +76,32 @@ class Appointment(Base):
         DateTime(timezone=True),
         nullable=False,
     )
-    status: Mapped[str] = mapped_column(
-        String(32),
-        default="PENDING",
+    status: Mapped[AppointmentStatus] = mapped_column(
+        SAEnum(AppointmentStatus, name="appointment_status", native_enum=True),
+        default=AppointmentStatus.PENDING,
         nullable=False,
     )
     channel: Mapped[str] = mapped_column(String(32), nullable=False)
     reason: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=datetime.utcnow,
+        server_default=func.now(),
         nullable=False,
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=func.now(),
+        server_onupdate=func.now(),
         nullable=False,
     )
 
-    patient: Mapped["Patient"] = relationship(back_populates="appointments")
-    dentist: Mapped["Dentist"] = relationship(back_populates="appointments")
+    # Implicit lazy loads raise so N+1 access patterns fail loudly; query
+    # sites eager-load via backend.services.appointments.
+    patient: Mapped["Patient"] = relationship(
+        back_populates="appointments",
+        lazy="raise_on_sql",
+    )
+    dentist: Mapped["Dentist"] = relationship(
+        back_populates="appointments",
+        lazy="raise_on_sql",
+    )
@@ -6,4 +6,6 @@ from sqlalchemy.orm import DeclarativeBase
 class Base(DeclarativeBase):
     """Base class for all ORM models."""
 
-    pass
+    # Fetch server-generated timestamps with RETURNING at flush time so
+    # async sessions never need an implicit refresh to read them.
+    __mapper_args__ = {"eager_defaults": True}
@@ -2,14 +2,15 @@
 
 from fastapi import APIRouter
 
+from backend.routers.chat import router as chat_router
+from backend.routers.slack import router as slack_router
+
+_API_ROUTER = APIRouter()
+_API_ROUTER.include_router(chat_router, tags=["chat"])
+_API_ROUTER.include_router(slack_router, prefix="/slack", tags=["slack"])
 
-def get_api_router() -> APIRouter:
-    """Construct and return the API router."""
 
-    from backend.routers.chat import router as chat_router
-    from backend.routers.slack import router as slack_router
+def get_api_router() -> APIRouter:
+    """Return the API router assembled at import time."""
 
-    api_router = APIRouter()
-    api_router.include_router(chat_router, tags=["chat"])
-    api_router.include_router(slack_router, prefix="/slack", tags=["slack"])
-    return api_router
+    return _API_ROUTER
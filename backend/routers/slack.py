@@ -1,12 +1,13 @@
 """Slack webhook router stub."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel
 
-from backend.services.cache import cache_get, cache_set
+from backend.services.cache import cache_pipeline
 from backend.utils.config import get_settings
 
 router = APIRouter()
+settings = get_settings()
 
 
 class SlackMessage(BaseModel):
@@ -17,13 +18,15 @@ class SlackMessage(BaseModel):
 
 
 @router.post("/events")
-def handle_slack_event(message: SlackMessage, settings=Depends(get_settings)) -> dict[str, str]:
+async def handle_slack_event(message: SlackMessage) -> dict[str, str]:
     """Stub handler for Slack events endpoint."""
 
     cache_key = f"slack:last_message:{message.user_id}"
-    cache_set(cache_key, message.text, ex=300)
+    async with cache_pipeline() as pipe:
+        pipe.set(name=cache_key, value=message.text, ex=300)
+        pipe.get(name=cache_key)
+        _, stored_message = await pipe.execute()
 
-    stored_message = cache_get(cache_key)
     if stored_message is None:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to cache message")
 
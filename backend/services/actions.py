@@ -0,0 +1,203 @@
+"""Backend side-effects for LLM-emitted conversation actions."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from typing import Any, Dict, Optional
+
+import orjson
+from fastapi import BackgroundTasks
+
+from backend.services.cache import cache_delete, cache_get, cache_set
+from backend.services.session import (
+    SESSION_TTL_SECONDS,
+    apply_booking_status,
+    get_available_slots,
+    set_available_slots,
+)
+from calendar_service.cal_adapter import CalComAdapter
+
+LOGGER = logging.getLogger(__name__)
+
+# Slot lookups go stale quickly; cache them only briefly.
+SLOTS_CACHE_PREFIX = "cal:slots:"
+SLOTS_CACHE_TTL_SECONDS = 120
+
+BOOKING_RESULT_PREFIX = "booking:"
+BOOKING_IN_PROGRESS = "booking_in_progress"
+BOOKING_FAILED = {"status": "FAILED"}
+
+
+async def execute_action(
+    *,
+    action_type: str,
+    session_id: str,
+    session_state: Dict[str, Any],
+    action_payload: Dict[str, Any],
+    calendar_client: CalComAdapter,
+    background_tasks: BackgroundTasks,
+) -> Optional[str]:
+    """Perform backend side-effects for the given action.
+
+    Returns the booking status to surface to the channel when a booking was
+    scheduled, otherwise ``None``.
+    """
+
+    metadata = session_state["metadata"]
+
+    if action_type == "CHECK_AVAILABILITY":
+        preferences = session_state["preferences"]
+        slots_cache_key = _slots_cache_key(preferences)
+        cached_slots = await cache_get(slots_cache_key)
+        if cached_slots is not None:
+            slots = orjson.loads(cached_slots)
+        else:
+            slots, live = await calendar_client.fetch_availability(preferences)
+            # Stub fallbacks are not bookable, so never share them via cache.
+            if live:
+                await cache_set(
+                    slots_cache_key,
+                    orjson.dumps(slots),
+                    ex=SLOTS_CACHE_TTL_SECONDS,
+                )
+        set_available_slots(session_state, slots)
+        metadata["available_slot_count"] = len(slots)
+        return None
+
+    if action_type == "BOOK_SLOT":
+        booking_status = book_selected_slot(
+            session_id,
+            session_state,
+            action_payload,
+            calendar_client,
+            background_tasks,
+        )
+        if booking_status:
+            # Drop any earlier outcome so it is not merged for this booking.
+            await cache_delete(booking_result_key(session_id))
+            metadata["booking_status"] = booking_status
+            metadata.pop("booking_error", None)
+        else:
+            metadata.setdefault("booking_error", "slot_not_found")
+        return booking_status
+
+    if action_type == "CONNECT_STAFF":
+        metadata["escalation_requested"] = True
+        note = action_payload.get("notes") or action_payload.get("explain")
+        if note:
+            metadata["escalation_note"] = note
+        return None
+
+    if action_type == "SESSION_COMPLETE":
+        metadata["session_closed"] = True
+        return None
+
+    return None
+
+
+def book_selected_slot(
+    session_id: str,
+    session_state: Dict[str, Any],
+    action_payload: Dict[str, Any],
+    calendar_client: CalComAdapter,
+    background_tasks: BackgroundTasks,
+) -> Optional[str]:
+    """Schedule a background booking for the slot referenced in the action."""
+
+    slots = get_available_slots(session_state)
+    if not slots:
+        return None
+
+    slot: Optional[Dict[str, Any]] = None
+    slot_index = action_payload.get("slot_index")
+    slot_id = action_payload.get("slot_id")
+
+    if isinstance(slot_index, int) and 0 <= slot_index < len(slots):
+        slot = slots[slot_index]
+    elif slot_id:
+        idx = session_state.get("_slots_by_id", {}).get(str(slot_id))
+        slot = slots[idx] if idx is not None else None
+
+    if not slot:
+        return None
+
+    patient = session_state["patient"]
+    if not patient.get("email"):
+        session_state["metadata"]["booking_error"] = "missing_patient_email"
+        return None
+
+    background_tasks.add_task(
+        perform_booking,
+        session_id,
+        slot,
+        patient,
+        calendar_client,
+    )
+    return BOOKING_IN_PROGRESS
+
+
+async def perform_booking(
+    session_id: str,
+    slot: Dict[str, Any],
+    patient: Dict[str, Any],
+    calendar_client: CalComAdapter,
+) -> None:
+    """Book the slot with cal.com after the chat reply has been sent.
+
+    Only the outcome is written, under ``booking:<session_id>``, for polling.
+    The session itself is left to the next chat turn (see
+    ``sync_booking_result``) so this task never races a turn's write.
+    """
+
+    try:
+        booking = await calendar_client.book_appointment(slot=slot, patient=patient)
+    except Exception as exc:
+        LOGGER.error("Background booking failed: session=%s error=%s", session_id, exc)
+        booking = None
+
+    await cache_set(
+        booking_result_key(session_id),
+        orjson.dumps(booking or BOOKING_FAILED),
+        ex=SESSION_TTL_SECONDS,
+    )
+
+
+async def sync_booking_result(session_id: str, session_state: Dict[str, Any]) -> None:
+    """Merge a finished background booking into the session state.
+
+    Only runs while a booking is in progress, so each outcome is merged once.
+    """
+
+    metadata = session_state["metadata"]
+    if metadata.get("booking_status") != BOOKING_IN_PROGRESS:
+        return
+
+    raw_result = await cache_get(booking_result_key(session_id))
+    if raw_result is None:
+        return
+
+    booking = orjson.loads(raw_result)
+    metadata.pop("booking_status", None)
+    if booking == BOOKING_FAILED:
+        metadata["booking_error"] = "booking_failed"
+        return
+
+    metadata["latest_booking"] = booking
+    metadata.pop("booking_error", None)
+    apply_booking_status(session_state, booking)
+
+
+def booking_result_key(session_id: str) -> str:
+    """Return the Redis key holding a session's background booking result."""
+
+    return f"{BOOKING_RESULT_PREFIX}{session_id}"
+
+
+def _slots_cache_key(preferences: Dict[str, Any]) -> str:
+    """Key availability results on the normalized booking preferences."""
+
+    digest = hashlib.sha256(
+        orjson.dumps(preferences, option=orjson.OPT_SORT_KEYS)
+    ).hexdigest()
+    return f"{SLOTS_CACHE_PREFIX}{digest}"
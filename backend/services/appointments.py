@@ -0,0 +1,68 @@
+"""Appointment query builders with eager-loaded relationships."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import Select, select
+from sqlalchemy.orm import selectinload
+
+from backend.models.appointment import Appointment
+from backend.models.dentist import Dentist
+from backend.models.patient import Patient
+
+
+def appointments_query() -> Select:
+    """Select appointments with their patient and dentist preloaded.
+
+    Listing N appointments costs three queries (appointments, patients,
+    dentists) instead of one extra SELECT per row.
+    """
+
+    return select(Appointment).options(
+        selectinload(Appointment.patient),
+        selectinload(Appointment.dentist),
+    )
+
+
+def dentist_schedule_query(
+    dentist_id: int,
+    start: datetime,
+    end: datetime,
+) -> Select:
+    """Select a dentist's appointments starting within ``[start, end)``."""
+
+    return (
+        appointments_query()
+        .where(
+            Appointment.dentist_id == dentist_id,
+            Appointment.start_time >= start,
+            Appointment.start_time < end,
+        )
+        .order_by(Appointment.start_time)
+    )
+
+
+def patient_upcoming_query(patient_id: int, after: datetime) -> Select:
+    """Select a patient's appointments starting at or after ``after``."""
+
+    return (
+        appointments_query()
+        .where(
+            Appointment.patient_id == patient_id,
+            Appointment.start_time >= after,
+        )
+        .order_by(Appointment.start_time)
+    )
+
+
+def dentists_with_appointments_query() -> Select:
+    """Select dentists with their appointment collections preloaded."""
+
+    return select(Dentist).options(selectinload(Dentist.appointments))
+
+
+def patients_with_appointments_query() -> Select:
+    """Select patients with their appointment collections preloaded."""
+
+    return select(Patient).options(selectinload(Patient.appointments))
@@ -2,28 +2,49 @@
 
 from typing import Any, Optional
 
-import redis
+import redis.asyncio as aioredis
+from redis.asyncio.client import Pipeline
 
 from backend.utils.config import get_settings
 
 settings = get_settings()
 
-redis_client = redis.Redis.from_url(settings.redis_url, decode_responses=True)
+redis_pool = aioredis.ConnectionPool.from_url(
+    settings.redis_url,
+    max_connections=50,
+    decode_responses=True,
+)
+redis_client = aioredis.Redis(connection_pool=redis_pool)
 
 
-def cache_set(key: str, value: Any, ex: Optional[int] = None) -> bool:
+async def cache_set(key: str, value: Any, ex: Optional[int] = None) -> bool:
     """Set a value in Redis with optional expiration."""
 
-    return bool(redis_client.set(name=key, value=value, ex=ex))
+    return bool(await redis_client.set(name=key, value=value, ex=ex))
 
 
-def cache_get(key: str) -> Optional[str]:
+async def cache_get(key: str) -> Optional[str]:
     """Get a value from Redis by key."""
 
-    return redis_client.get(name=key)
+    return await redis_client.get(name=key)
 
 
-def cache_delete(key: str) -> int:
+async def cache_delete(key: str) -> int:
     """Delete a value from Redis by key."""
 
-    return int(redis_client.delete(key))
+    return int(await redis_client.delete(key))
+
+
+def cache_pipeline(transaction: bool = False) -> Pipeline:
+    """Return a pipeline for batching commands in one RTT.
+
+    Pass ``transaction=True`` to wrap the batch in MULTI/EXEC.
+    """
+
+    return redis_client.pipeline(transaction=transaction)
+
+
+async def close_cache() -> None:
+    """Disconnect pooled Redis connections."""
+
+    await redis_pool.disconnect()
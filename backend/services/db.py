@@ -1,28 +1,63 @@
 """Database session management utilities."""
 
-from contextlib import contextmanager
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from backend.utils.config import get_settings
 
 settings = get_settings()
 
-engine = create_engine(settings.postgres_url, future=True, echo=False)
-SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
 
+def _async_database_url(url: str) -> str:
+    """Rewrite a PostgreSQL URL to use the asyncpg driver."""
 
-@contextmanager
-def get_session() -> Session:
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "postgresql":
+        parsed = parsed.set(drivername="postgresql+asyncpg")
+    return parsed.render_as_string(hide_password=False)
+
+
+engine = create_async_engine(
+    _async_database_url(settings.postgres_url),
+    pool_size=20,
+    max_overflow=30,
+    pool_recycle=300,
+    pool_pre_ping=True,
+    echo=False,
+)
+SessionLocal = async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
+
+
+@asynccontextmanager
+async def get_session() -> AsyncIterator[AsyncSession]:
     """Provide a transactional scope around a series of operations."""
 
-    session: Session = SessionLocal()
+    session: AsyncSession = SessionLocal()
     try:
         yield session
-        session.commit()
+        await session.commit()
     except Exception:
-        session.rollback()
+        await session.rollback()
         raise
     finally:
-        session.close()
+        await session.close()
+
+
+async def get_db() -> AsyncIterator[AsyncSession]:
+    """FastAPI dependency yielding a request-scoped transactional session."""
+
+    async with get_session() as session:
+        yield session
+
+
+async def close_db() -> None:
+    """Dispose pooled database connections."""
+
+    await engine.dispose()
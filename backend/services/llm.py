@@ -2,16 +2,58 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 import re
+from concurrent.futures import ProcessPoolExecutor
 from textwrap import dedent
 from typing import Any, Dict, List, Literal, Optional
 
+import httpx
+import orjson
 from pydantic import AliasChoices, BaseModel, ConfigDict, Field, ValidationError
 
 LOGGER = logging.getLogger(__name__)
 
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+# Typical replies are ~1 KB and parse faster than a pickle round trip, so only
+# unusually large outputs are parsed off the event loop.
+PARSE_OFFLOAD_MIN_CHARS = 64_000
+PARSE_MAX_WORKERS = 2
+
+# Bound in-flight OpenAI calls per worker; the SDK retries 429/5xx itself
+# with exponential backoff.
+OPENAI_MAX_CONCURRENCY = 10
+OPENAI_MAX_RETRIES = 3
+
+# Stub-path entity extraction patterns, compiled once at import.
+COMMA_NAME_PHONE_RE = re.compile(r"\s*([a-zA-Z][a-zA-Z\s]+),\s*(\+?\d[\d\s-]{6,})")
+BARE_NAME_RE = re.compile(r"^[A-Za-z][A-Za-z\s]{2,40}$")
+# Each field is searched on its own so one capture cannot swallow another.
+# Possessive quantifiers never give characters back, so a non-matching
+# message cannot trigger backtracking blow-ups.
+NAME_RE = re.compile(r"(?:my name is|i am)\s+([a-zA-Z\s]++)")
+# Phone numbers start a digit run and may not start inside or run into an
+# ISO date ("\d-" before a digit only occurs mid-date or mid-number).
+PHONE_RE = re.compile(r"(?<!\d)(?<!\d-)(\+?(?!20\d{2}-\d{2}-\d{2})\d(?:(?!20\d{2}-\d{2}-\d{2})[\d\s-]){7,}+)")
+# Only try an email at the start of a token, not at every offset in it.
+EMAIL_RE = re.compile(r"(?<![\w.%-])[\w.%-]++@[\w.-]++")
+DATE_RE = re.compile(r"(20\d{2}-\d{2}-\d{2})")
+NON_DIGIT_RE = re.compile(r"\D")
+
+STUB_PATIENT_FIELDS: Dict[str, str] = {
+    "patient_name": "name",
+    "patient_phone": "phone",
+    "patient_email": "email",
+}
+STUB_PREFERENCE_FIELDS: Dict[str, str] = {
+    "preferred_date": "date",
+    "preferred_time_window": "time_window",
+    "dentist_id": "dentist_id",
+    "reason": "reason",
+}
+
 SYSTEM_PROMPT = dedent(
     """
     You are RAAS Assistant — the polite, concise receptionist for Dentist Verma Clinic.
@@ -83,6 +125,35 @@ JSON_RESPONSE_EXAMPLE = dedent(
     """
 ).strip()
 
+DEVELOPER_PROMPT_TEMPLATE = dedent(
+    """
+    Conversation context (JSON):
+    {context}
+
+    Recent dialogue:
+    {history}
+
+    Latest user message:
+    """
+).strip()
+
+# Everything after the per-turn context is static, so join it once.
+STATIC_INSTRUCTIONS = "\n\n".join(
+    [
+        CONTACT_REQUIREMENTS,
+        DATE_HANDLING_GUIDANCE,
+        ALLOWED_ACTIONS_TEXT,
+        JSON_RESPONSE_EXAMPLE,
+    ]
+)
+
+SYSTEM_MESSAGE: Dict[str, Any] = {
+    "role": "system",
+    "content": [
+        {"type": "input_text", "text": SYSTEM_PROMPT},
+    ],
+}
+
 
 class LLMAction(BaseModel):
     """Structured action directive emitted by the LLM."""
@@ -119,6 +190,20 @@ class LLMResponse(BaseModel):
     extracted: Dict[str, Any] = Field(default_factory=dict)
 
 
+def _parse_llm_output(raw_output: str) -> LLMResponse:
+    """Validate and coerce OpenAI output into LLMResponse.
+
+    JSON decoding and schema validation happen in a single pydantic-core
+    pass. Kept at module level so it can be pickled into a worker process.
+    """
+
+    try:
+        return LLMResponse.model_validate_json(raw_output)
+    except ValidationError:
+        LOGGER.debug("LLM output failed validation (truncated): %s", raw_output[:500])
+        raise
+
+
 class RAASLLMClient:
     """Facade over the OpenAI client with graceful fallbacks."""
 
@@ -135,18 +220,39 @@ class RAASLLMClient:
         self.temperature = temperature
         self.use_stub = use_stub or not self.api_key
         self._client = None
+        self._parse_executor: Optional[ProcessPoolExecutor] = None
+        self._call_slots = asyncio.Semaphore(OPENAI_MAX_CONCURRENCY)
 
-        if self.api_key and not self.use_stub:
-            try:
-                # Imported lazily to avoid heavy import cost.
-                from openai import OpenAI
+    def open(self) -> None:
+        """Create the pooled AsyncOpenAI client when the live path is enabled."""
 
-                self._client = OpenAI(api_key=self.api_key)
-            except Exception as exc:  # pragma: no cover - defensive
-                LOGGER.warning("Failed to initialize OpenAI client: %s", exc)
-                self._client = None
+        if self.use_stub or self._client is not None:
+            return
 
-    def generate_response(
+        try:
+            # Imported lazily to avoid heavy import cost.
+            from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+            self._client = AsyncOpenAI(
+                api_key=self.api_key,
+                max_retries=OPENAI_MAX_RETRIES,
+                http_client=DefaultAsyncHttpxClient(limits=HTTP_LIMITS),
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            LOGGER.warning("Failed to initialize OpenAI client: %s", exc)
+            self._client = None
+
+    async def aclose(self) -> None:
+        """Close the pooled OpenAI HTTP client."""
+
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+        if self._parse_executor is not None:
+            self._parse_executor.shutdown(wait=False, cancel_futures=True)
+            self._parse_executor = None
+
+    async def generate_response(
         self,
         *,
         session: Dict[str, Any],
@@ -157,6 +263,9 @@ class RAASLLMClient:
 
         cleaned_message = message_text.strip()
 
+        if not self.use_stub:
+            self.open()
+
         if self.use_stub or not self._client:
             LOGGER.debug("Using stubbed LLM response path")
             return self._stub_response(
@@ -165,12 +274,12 @@ class RAASLLMClient:
             )
 
         try:
-            raw_output = self._call_openai(
+            raw_output = await self._call_openai(
                 session=session,
                 message_text=cleaned_message,
                 channel=channel,
             )
-            return self._parse_llm_output(raw_output)
+            return await self._parse_output(raw_output)
         except (ValueError, ValidationError) as exc:
             LOGGER.error("Invalid LLM output; falling back. error=%s", exc)
         except Exception as exc:  # pragma: no cover - defensive
@@ -181,7 +290,23 @@ class RAASLLMClient:
             message_text=cleaned_message,
         )
 
-    def _call_openai(
+    async def _parse_output(self, raw_output: str) -> LLMResponse:
+        """Parse LLM output, moving large payloads to a worker process."""
+
+        if len(raw_output) < PARSE_OFFLOAD_MIN_CHARS:
+            return _parse_llm_output(raw_output)
+
+        if self._parse_executor is None:
+            # Created on first use so regular replies never fork workers.
+            self._parse_executor = ProcessPoolExecutor(max_workers=PARSE_MAX_WORKERS)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._parse_executor,
+            _parse_llm_output,
+            raw_output,
+        )
+
+    async def _call_openai(
         self,
         *,
         session: Dict[str, Any],
@@ -199,19 +324,15 @@ class RAASLLMClient:
             channel=channel,
         )
 
-        response = self._client.responses.create(
-            model=self.model,
-            input=messages,
-            temperature=self.temperature,
-        )
-
-        text_chunks: List[str] = []
-        for item in getattr(response, "output", []) or []:
-            for part in getattr(item, "content", []) or []:
-                if getattr(part, "type", None) == "output_text":
-                    text_chunks.append(getattr(part, "text", ""))
+        async with self._call_slots:
+            response = await self._client.responses.create(
+                model=self.model,
+                input=messages,
+                temperature=self.temperature,
+            )
 
-        raw_text = "".join(text_chunks).strip()
+        # The SDK joins the output_text parts of message items for us.
+        raw_text = response.output_text.strip()
         if not raw_text:
             raise ValueError("Empty response from OpenAI")
 
@@ -230,37 +351,16 @@ class RAASLLMClient:
         context = self._render_context(session=session, channel=channel)
         history = self._render_history(session=session)
 
-        developer_prompt = dedent(
-            """
-            Conversation context (JSON):
-            {context}
-
-            Recent dialogue:
-            {history}
-
-            Latest user message:
-            """
-        ).strip().format(context=context, history=history)
-
-        instructions = "\n\n".join(
-            [
-                developer_prompt,
-                CONTACT_REQUIREMENTS,
-                DATE_HANDLING_GUIDANCE,
-                ALLOWED_ACTIONS_TEXT,
-                JSON_RESPONSE_EXAMPLE,
-            ]
+        developer_prompt = DEVELOPER_PROMPT_TEMPLATE.format(
+            context=context,
+            history=history,
         )
+        instructions = f"{developer_prompt}\n\n{STATIC_INSTRUCTIONS}"
 
         user_payload = f"{instructions}\n{message_text or ''}".strip()
 
         messages = [
-            {
-                "role": "system",
-                "content": [
-                    {"type": "input_text", "text": SYSTEM_PROMPT},
-                ],
-            },
+            SYSTEM_MESSAGE,
             {
                 "role": "user",
                 "content": [
@@ -286,37 +386,20 @@ class RAASLLMClient:
             "metadata": session.get("metadata", {}),
         }
 
-        return json.dumps(payload, ensure_ascii=False, default=str)
+        return orjson.dumps(
+            payload,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS,
+        ).decode()
 
     def _render_history(self, *, session: Dict[str, Any]) -> str:
         """Return the condensed recent dialogue from session history."""
 
-        history = session.get("history", [])[-5:]
+        history = list(session.get("history", ()))[-5:]
         if not history:
             return "<no history>"
 
-        lines = [
-            f"{item['role']}: {item['content']}" for item in history
-        ]
-        return "\n".join(lines)
-
-    @staticmethod
-    def _parse_llm_output(raw_output: str) -> LLMResponse:
-        """Validate and coerce OpenAI output into LLMResponse."""
-
-        try:
-            payload = json.loads(raw_output)
-        except json.JSONDecodeError as exc:
-            LOGGER.debug("Raw LLM output (truncated): %s", raw_output[:500])
-            raise ValueError("LLM did not return valid JSON") from exc
-
-        try:
-            return LLMResponse.model_validate(payload)
-        except ValidationError as exc:
-            LOGGER.debug(
-                "LLM payload failed validation: %s", json.dumps(payload)[:500]
-            )
-            raise
+        return "\n".join(f"{item['role']}: {item['content']}" for item in history)
 
     def _stub_response(
         self,
@@ -324,30 +407,30 @@ class RAASLLMClient:
         session: Dict[str, Any],
         message_text: str,
     ) -> LLMResponse:
-        """Rule-based fallback that mirrors the designed flow."""
+        """Rule-based fallback that mirrors the designed flow.
+
+        Every field here is built internally from literals, so the models are
+        created with ``model_construct`` and skip validation; only real LLM
+        output goes through ``model_validate``.
+        """
 
         metadata = session.setdefault("metadata", {})
         extracted = self._extract_stub_fields(message_text)
 
-        proposed_patient = dict(session.get("patient", {}))
-        proposed_preferences = dict(session.get("preferences", {}))
-
-        if "patient_name" in extracted:
-            proposed_patient["name"] = extracted["patient_name"]
-        if "patient_phone" in extracted:
-            proposed_patient["phone"] = extracted["patient_phone"]
-        if "patient_email" in extracted:
-            proposed_patient["email"] = extracted["patient_email"]
-        if "preferred_date" in extracted:
-            proposed_preferences["date"] = extracted["preferred_date"]
-        if "preferred_time_window" in extracted:
-            proposed_preferences["time_window"] = extracted[
-                "preferred_time_window"
-            ]
-        if "dentist_id" in extracted:
-            proposed_preferences["dentist_id"] = extracted["dentist_id"]
-        if "reason" in extracted:
-            proposed_preferences["reason"] = extracted["reason"]
+        # Copy the stored buckets only when this turn overrides a field in them.
+        proposed_patient = session.get("patient", {})
+        if any(field in extracted for field in STUB_PATIENT_FIELDS):
+            proposed_patient = dict(proposed_patient)
+            for field, key in STUB_PATIENT_FIELDS.items():
+                if field in extracted:
+                    proposed_patient[key] = extracted[field]
+
+        proposed_preferences = session.get("preferences", {})
+        if any(field in extracted for field in STUB_PREFERENCE_FIELDS):
+            proposed_preferences = dict(proposed_preferences)
+            for field, key in STUB_PREFERENCE_FIELDS.items():
+                if field in extracted:
+                    proposed_preferences[key] = extracted[field]
 
         missing_fields: List[str] = []
         if not proposed_patient.get("name"):
@@ -378,11 +461,11 @@ class RAASLLMClient:
                     "I need the appointment date in YYYY-MM-DD format, including "
                     "the year. Could you share it again?"
                 )
-            action = LLMAction(
+            action = LLMAction.model_construct(
                 type="COLLECT_INFO",
                 missing_fields=["preferred_date"],
             )
-            return LLMResponse(
+            return LLMResponse.model_construct(
                 reply_to_user=reply,
                 action=action,
                 extracted=extracted,
@@ -396,11 +479,11 @@ class RAASLLMClient:
                 "I need an email address to confirm your appointment. "
                 "Could you please share it?"
             )
-            action = LLMAction(
+            action = LLMAction.model_construct(
                 type="COLLECT_INFO",
                 missing_fields=["patient_email"],
             )
-            return LLMResponse(
+            return LLMResponse.model_construct(
                 reply_to_user=reply,
                 action=action,
                 extracted=extracted,
@@ -412,12 +495,12 @@ class RAASLLMClient:
                 "Okay — sending your request to clinic. "
                 "You’ll be notified when doctor confirms."
             )
-            action = LLMAction(
+            action = LLMAction.model_construct(
                 type="BOOK_SLOT",
                 slot_index=index,
             )
             metadata["stub_state"] = "booking"
-            return LLMResponse(
+            return LLMResponse.model_construct(
                 reply_to_user=reply,
                 action=action,
                 extracted=extracted,
@@ -433,9 +516,9 @@ class RAASLLMClient:
                 + "; ".join(slot_lines)
                 + ". Reply with the option number."
             )
-            action = LLMAction(type="AWAIT_SLOT_SELECTION")
+            action = LLMAction.model_construct(type="AWAIT_SLOT_SELECTION")
             metadata["slots_presented"] = True
-            return LLMResponse(
+            return LLMResponse.model_construct(
                 reply_to_user=reply,
                 action=action,
                 extracted=extracted,
@@ -447,12 +530,12 @@ class RAASLLMClient:
                 + " and ".join(missing_fields)
                 + "?"
             )
-            action = LLMAction(
+            action = LLMAction.model_construct(
                 type="COLLECT_INFO",
                 missing_fields=missing_fields,
             )
             metadata["stub_state"] = "collecting"
-            return LLMResponse(
+            return LLMResponse.model_construct(
                 reply_to_user=reply,
                 action=action,
                 extracted=extracted,
@@ -463,12 +546,12 @@ class RAASLLMClient:
                 "Thanks. Could you share your preferred date "
                 "(YYYY-MM-DD) and time window?"
             )
-            action = LLMAction(
+            action = LLMAction.model_construct(
                 type="COLLECT_INFO",
                 missing_fields=["preferred_date", "preferred_time_window"],
             )
             metadata["stub_state"] = "collecting_preferences"
-            return LLMResponse(
+            return LLMResponse.model_construct(
                 reply_to_user=reply,
                 action=action,
                 extracted=extracted,
@@ -483,10 +566,10 @@ class RAASLLMClient:
             "Thanks. I will check available slots for "
             f"{pref_date} in the {pref_window}."
         )
-        action = LLMAction(type="CHECK_AVAILABILITY")
+        action = LLMAction.model_construct(type="CHECK_AVAILABILITY")
         metadata["stub_state"] = "checking"
 
-        return LLMResponse(
+        return LLMResponse.model_construct(
             reply_to_user=reply,
             action=action,
             extracted=extracted,
@@ -501,28 +584,28 @@ class RAASLLMClient:
         extracted: Dict[str, Any] = {}
         lowered = message_text.lower()
 
-        comma_match = re.match(r"\s*([a-zA-Z][a-zA-Z\s]+),\s*(\+?\d[\d\s-]{6,})", message_text)
+        comma_match = COMMA_NAME_PHONE_RE.match(message_text)
         if comma_match:
             extracted["patient_name"] = comma_match.group(1).strip().title()
-            extracted["patient_phone"] = re.sub(r"\D", "", comma_match.group(2))
+            extracted["patient_phone"] = NON_DIGIT_RE.sub("", comma_match.group(2))
 
-        name_match = re.search(r"(?:my name is|i am)\s+([a-zA-Z\s]+)", lowered)
+        name_match = NAME_RE.search(lowered)
         if name_match:
             extracted["patient_name"] = name_match.group(1).strip().title()
 
-        phone_match = re.search(r"(\+?\d[\d\s-]{7,})", message_text)
+        phone_match = PHONE_RE.search(message_text)
         if phone_match:
-            extracted["patient_phone"] = re.sub(r"\D", "", phone_match.group(1))
+            extracted["patient_phone"] = NON_DIGIT_RE.sub("", phone_match.group(1))
 
-        email_match = re.search(r"[\w.%-]+@[\w.-]+", message_text)
+        email_match = EMAIL_RE.search(message_text)
         if email_match:
             extracted["patient_email"] = email_match.group(0)
 
         if "patient_name" not in extracted:
-            if re.match(r"^[A-Za-z][A-Za-z\s]{2,40}$", message_text.strip()):
+            if BARE_NAME_RE.match(message_text.strip()):
                 extracted["patient_name"] = message_text.strip().title()
 
-        date_match = re.search(r"(20\d{2}-\d{2}-\d{2})", message_text)
+        date_match = DATE_RE.search(message_text)
         if date_match:
             extracted["preferred_date"] = date_match.group(1)
 
@@ -539,8 +622,9 @@ class RAASLLMClient:
     def _extract_slot_selection(message_text: str) -> Optional[int]:
         """Translate numeric user replies into zero-based slot index."""
 
-        if not message_text or not message_text.strip().isdigit():
+        token = message_text.strip() if message_text else ""
+        # int() alone would also take signs and digit separators ("+2", "1_0").
+        if not token.isdecimal():
             return None
 
-        choice = int(message_text.strip())
-        return max(0, choice - 1)
+        return max(0, int(token) - 1)
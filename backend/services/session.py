@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
-import json
 import logging
-from copy import deepcopy
-from datetime import datetime
+from collections import deque
+from datetime import date, datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
-from backend.services.cache import cache_delete, cache_get, cache_set
+import orjson
+
+from backend.services.cache import cache_pipeline
 
 LOGGER = logging.getLogger(__name__)
 SESSION_PREFIX = "raas:session:"
@@ -41,18 +43,15 @@ ACTION_STATUS_MAP: Dict[str, str] = {
     "SESSION_COMPLETE": "CLOSED",
 }
 
-BOOKING_STATUS_VALUES = {"PENDING", "CONFIRMED", "CANCELLED"}
+# Next status and its priority per action, resolved in a single lookup.
+ACTION_TRANSITIONS: Dict[str, Tuple[str, int]] = {
+    action: (status, STATUS_PRIORITY[status])
+    for action, status in ACTION_STATUS_MAP.items()
+}
+GREETING_TRANSITION: Tuple[str, int] = ("GREETING", STATUS_PRIORITY["GREETING"])
 
+BOOKING_STATUS_VALUES = {"PENDING", "CONFIRMED", "CANCELLED"}
 
-DEFAULT_SESSION_STATE: Dict[str, Any] = {
-    "status": SESSION_STATUS_DEFAULT,
-    "patient": {},
-    "preferences": {},
-    "available_slots": [],
-    "extracted": {},
-    "history": [],
-    "metadata": {},
-}
 
 PATIENT_FIELD_MAP: Dict[str, Tuple[str, str]] = {
     "patient_name": ("patient", "name"),
@@ -68,61 +67,172 @@ PREFERENCE_FIELD_MAP: Dict[str, Tuple[str, str]] = {
     "reason": ("preferences", "reason"),
 }
 
+# Single routing table so each extracted key costs one lookup.
+FIELD_ROUTES: Dict[str, Tuple[str, str]] = {
+    **PATIENT_FIELD_MAP,
+    **PREFERENCE_FIELD_MAP,
+}
+
 HISTORY_MAX_ENTRIES = 10
 
+SESSION_CONTAINER_FIELDS = ("patient", "preferences", "extracted", "metadata")
+
 
 def _session_key(session_id: str) -> str:
-    return f"{SESSION_PREFIX}{session_id}"
+    # The hash tag keeps a session's hash and history list in one cluster slot.
+    return f"{SESSION_PREFIX}{{{session_id}}}"
+
+
+def _history_key(session_id: str) -> str:
+    return f"{_session_key(session_id)}:history"
+
+
+def _encode(value: Any) -> str:
+    return orjson.dumps(value, default=str).decode()
 
 
 def new_session_state() -> Dict[str, Any]:
-    """Return an isolated copy of the default session payload."""
+    """Return a fresh default session payload."""
+
+    return {
+        "status": SESSION_STATUS_DEFAULT,
+        "patient": {},
+        "preferences": {},
+        "available_slots": [],
+        "extracted": {},
+        "history": deque(maxlen=HISTORY_MAX_ENTRIES),
+        "metadata": {},
+    }
 
-    return deepcopy(DEFAULT_SESSION_STATE)
 
+async def _fetch_session(session_id: str) -> Tuple[Dict[str, str], Dict[str, Any]]:
+    """Return the stored hash fields and the decoded session state.
 
-def load_session(session_id: str) -> Dict[str, Any]:
-    """Load a session from Redis, creating a new one if missing."""
+    Top-level fields live in a hash and the history in a list; both are read
+    in a single pipelined round trip. The raw fields are empty whenever a
+    fresh state is returned.
+    """
 
-    raw_state = cache_get(_session_key(session_id))
-    if raw_state is None:
+    pipe = cache_pipeline()
+    pipe.hgetall(_session_key(session_id))
+    pipe.lrange(_history_key(session_id), 0, -1)
+    fields, history = await pipe.execute()
+    if not fields:
         LOGGER.debug(
             "Session %s not found; creating new state",
             session_id,
         )
-        return new_session_state()
+        return {}, new_session_state()
 
     try:
-        state: Dict[str, Any] = json.loads(raw_state)
-    except json.JSONDecodeError:
+        state: Dict[str, Any] = {
+            name: orjson.loads(value) for name, value in fields.items()
+        }
+        state["history"] = deque(
+            (orjson.loads(entry) for entry in history),
+            maxlen=HISTORY_MAX_ENTRIES,
+        )
+    except orjson.JSONDecodeError:
         LOGGER.warning(
             "Session %s payload invalid JSON; resetting",
             session_id,
         )
-        return new_session_state()
+        # Delta flushes only rewrite changed fields, so drop the corrupt hash.
+        await delete_session(session_id)
+        return {}, new_session_state()
 
     if is_session_terminal(state):
         LOGGER.debug("Session %s is terminal; resetting state", session_id)
-        delete_session(session_id)
-        return new_session_state()
+        await delete_session(session_id)
+        return {}, new_session_state()
+
+    # Guarantee the container fields once so callers can index directly.
+    for name in SESSION_CONTAINER_FIELDS:
+        state.setdefault(name, {})
 
-    return state
+    return fields, state
 
 
-def save_session(session_id: str, state: Dict[str, Any]) -> None:
-    """Persist session state to Redis with a TTL."""
+class SessionBuffer:
+    """Accumulate one request's session changes and write them back at once.
 
-    cache_set(
-        _session_key(session_id),
-        json.dumps(state),
-        ex=SESSION_TTL_SECONDS,
-    )
+    History turns are queued as they happen and only hash fields whose
+    encoded value changed since load are rewritten, so ``flush`` is a single
+    pipeline of ``HSET`` + ``RPUSH`` + ``LTRIM`` + ``EXPIRE``.
+    """
 
+    def __init__(
+        self,
+        session_id: str,
+        state: Dict[str, Any],
+        stored_fields: Optional[Dict[str, str]] = None,
+    ) -> None:
+        self.session_id = session_id
+        self.state = state
+        self._stored_fields = stored_fields or {}
+        self._history_appends: List[Dict[str, Any]] = []
 
-def delete_session(session_id: str) -> None:
-    """Remove a session from Redis."""
+    @classmethod
+    async def load(cls, session_id: str) -> "SessionBuffer":
+        """Load a session and start buffering changes against it."""
 
-    cache_delete(_session_key(session_id))
+        stored_fields, state = await _fetch_session(session_id)
+        return cls(session_id, state, stored_fields)
+
+    def append_history(self, role: str, content: str) -> None:
+        """Append a turn to the state and queue it for the history list."""
+
+        append_history(self.state, role, content)
+        self._history_appends.append(self.state["history"][-1])
+
+    async def flush(self) -> None:
+        """Write changed fields and queued history turns in one pipeline."""
+
+        session_key = _session_key(self.session_id)
+        history_key = _history_key(self.session_id)
+        changed = {}
+        for name, value in self.state.items():
+            if name == "history":
+                continue
+            encoded = _encode(value)
+            if self._stored_fields.get(name) != encoded:
+                changed[name] = encoded
+
+        if self._stored_fields:
+            history = self._history_appends
+        else:
+            # Nothing stored yet (or the old payload was discarded), so the
+            # whole history has to be written.
+            history = self.state.get("history") or []
+
+        # Hash and history share a hash slot, so MULTI/EXEC keeps them in
+        # step. An unchanged session only needs its TTLs refreshed.
+        writes = bool(changed or history or not self._stored_fields)
+        pipe = cache_pipeline(transaction=writes)
+        if changed:
+            pipe.hset(session_key, mapping=changed)
+        if not self._stored_fields:
+            pipe.delete(history_key)
+        if history:
+            pipe.rpush(
+                history_key,
+                *(orjson.dumps(entry, default=str) for entry in history),
+            )
+            pipe.ltrim(history_key, -HISTORY_MAX_ENTRIES, -1)
+        pipe.expire(session_key, SESSION_TTL_SECONDS)
+        pipe.expire(history_key, SESSION_TTL_SECONDS)
+        await pipe.execute()
+
+        self._stored_fields.update(changed)
+        self._history_appends.clear()
+
+
+async def delete_session(session_id: str) -> None:
+    """Remove a session and its history from Redis."""
+
+    pipe = cache_pipeline()
+    pipe.delete(_session_key(session_id), _history_key(session_id))
+    await pipe.execute()
 
 
 def is_session_terminal(state: Dict[str, Any]) -> bool:
@@ -148,15 +258,12 @@ def is_session_terminal(state: Dict[str, Any]) -> bool:
 def append_history(state: Dict[str, Any], role: str, content: str) -> None:
     """Append a conversation turn to the session history."""
 
-    state.setdefault("history", [])
     history_entry = {
         "role": role,
         "content": content,
     }
+    # History is a bounded deque, so the oldest turn drops off automatically.
     state["history"].append(history_entry)
-    overflow = len(state["history"]) - HISTORY_MAX_ENTRIES
-    if overflow > 0:
-        del state["history"][:overflow]
 
 
 def merge_extracted_data(
@@ -168,11 +275,9 @@ def merge_extracted_data(
     if not extracted:
         return
 
-    state.setdefault("extracted", {})
-    for key, value in extracted.items():
-        if value is None:
-            continue
-        state["extracted"][key] = value
+    state["extracted"] |= {
+        key: value for key, value in extracted.items() if value is not None
+    }
 
     _apply_structured_fields(state, extracted)
 
@@ -183,19 +288,17 @@ def update_status_for_action(state: Dict[str, Any], action_type: str) -> None:
     if not action_type:
         return
 
-    next_status = ACTION_STATUS_MAP.get(action_type)
-
-    if (
-        action_type == "SMALL_TALK"
-        and state.get("status", SESSION_STATUS_DEFAULT) == SESSION_STATUS_DEFAULT
-    ):
-        next_status = "GREETING"
+    current_status = state.get("status", SESSION_STATUS_DEFAULT)
+    if action_type == "SMALL_TALK" and current_status == SESSION_STATUS_DEFAULT:
+        transition = GREETING_TRANSITION
+    else:
+        transition = ACTION_TRANSITIONS.get(action_type)
 
-    if not next_status:
+    if transition is None:
         return
 
-    current_status = state.get("status", SESSION_STATUS_DEFAULT)
-    if STATUS_PRIORITY.get(next_status, 0) >= STATUS_PRIORITY.get(current_status, 0):
+    next_status, next_priority = transition
+    if next_priority >= STATUS_PRIORITY.get(current_status, 0):
         state["status"] = next_status
 
 
@@ -224,36 +327,28 @@ def _apply_structured_fields(
 ) -> None:
     """Populate patient and preference sub-objects from extracted data."""
 
-    for field, (bucket, target_key) in PATIENT_FIELD_MAP.items():
-        if field not in extracted:
-            continue
-        state.setdefault(bucket, {})
-        state[bucket][target_key] = extracted[field]
-        if field == "patient_email" and extracted[field]:
-            metadata = state.setdefault("metadata", {})
-            if metadata.get("booking_error") == "missing_patient_email":
-                metadata.pop("booking_error", None)
-
-    for field, (bucket, target_key) in PREFERENCE_FIELD_MAP.items():
-        if field not in extracted:
+    metadata = state["metadata"]
+    for field, value in extracted.items():
+        route = FIELD_ROUTES.get(field)
+        if route is None:
             continue
+        bucket, target_key = route
 
         if field == "preferred_date":
-            normalized, error = _normalize_preferred_date(extracted[field])
-            metadata = state.setdefault("metadata", {})
+            normalized, error = _normalize_preferred_date(value)
             if error:
                 metadata["preferred_date_error"] = error
                 extracted[field] = None
-                state.setdefault(bucket, {}).pop(target_key, None)
+                state[bucket].pop(target_key, None)
                 continue
 
             metadata.pop("preferred_date_error", None)
             extracted[field] = normalized
             value = normalized
-        else:
-            value = extracted[field]
+        elif field == "patient_email" and value:
+            if metadata.get("booking_error") == "missing_patient_email":
+                metadata.pop("booking_error", None)
 
-        state.setdefault(bucket, {})
         state[bucket][target_key] = value
 
 
@@ -268,11 +363,10 @@ def _normalize_preferred_date(value: Any) -> Tuple[Optional[str], Optional[str]]
         return None, "invalid_format"
 
     try:
-        parsed = datetime.fromisoformat(raw)
+        target_date = _parse_iso_date(raw)
     except ValueError:
         return None, "invalid_format"
 
-    target_date = parsed.date()
     today = datetime.now().date()
     if target_date < today:
         return None, "past_date"
@@ -280,13 +374,30 @@ def _normalize_preferred_date(value: Any) -> Tuple[Optional[str], Optional[str]]
     return target_date.isoformat(), None
 
 
+@lru_cache(maxsize=512)
+def _parse_iso_date(raw: str) -> date:
+    """Parse an ISO date/datetime string; cached as dates repeat across turns."""
+
+    return datetime.fromisoformat(raw).date()
+
+
 def set_available_slots(
     state: Dict[str, Any],
     slots: List[Dict[str, Any]],
 ) -> None:
-    """Store normalized available slots in the session payload."""
+    """Store normalized available slots in the session payload.
+
+    Also records a slot_id -> index map so bookings by id are one lookup.
+    Ids are stringified because the map is stored as JSON, whose object keys
+    are always strings.
+    """
 
     state["available_slots"] = slots or []
+    state["_slots_by_id"] = {
+        str(slot["slot_id"]): idx
+        for idx, slot in enumerate(state["available_slots"])
+        if slot.get("slot_id")
+    }
 
 
 def get_available_slots(state: Dict[str, Any]) -> List[Dict[str, Any]]:
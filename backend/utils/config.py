@@ -1,6 +1,6 @@
 """Application configuration utilities."""
 
-from functools import lru_cache
+from functools import cache
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -73,7 +73,7 @@ class Settings(BaseSettings):
     )
 
 
-@lru_cache()
+@cache
 def get_settings() -> Settings:
     """Return cached settings instance."""
 
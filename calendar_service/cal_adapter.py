@@ -2,16 +2,22 @@
 
 from __future__ import annotations
 
-import json
 import logging
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 from zoneinfo import ZoneInfo
 
 import httpx
+import orjson
 
 LOGGER = logging.getLogger(__name__)
 
+UTC = ZoneInfo("UTC")
+
+# Local start hours of the deterministic stub slots.
+STUB_SLOT_HOURS = (18, 19)
+
 
 class CalComAdapter:
     """Adapter for interacting with the cal.com scheduling API."""
@@ -27,27 +33,67 @@ class CalComAdapter:
         event_duration_minutes: int = 30,
         use_stub: bool = False,
         timeout_seconds: float = 10.0,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
     ) -> None:
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
         self.event_type_id = event_type_id
         self.calendar_id = calendar_id
         self.timezone = timezone
+        self._tz = ZoneInfo(timezone)
         self.event_duration_minutes = max(1, event_duration_minutes)
         self.use_stub = use_stub or not api_key or not event_type_id
         self._timeout = timeout_seconds
         self._availability_url = "https://api.cal.com/v2/slots"
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self._base_headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+            "cal-api-version": "2024-09-04",
+        }
+        self._client: Optional[httpx.AsyncClient] = None
 
     # ---------------------------------------------------------------------
     # Public API
     # ---------------------------------------------------------------------
-    def check_availability(self, preferences: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def open(self) -> None:
+        """Create the pooled HTTP client reused across requests."""
+
+        self._http_client()
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client and release its connections."""
+
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def check_availability(
+        self, preferences: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
         """Return availability slots from cal.com.
 
         Falls back to deterministic test data if the adapter is in stub mode or
         if the API call fails.
         """
 
+        slots, _ = await self.fetch_availability(preferences)
+        return slots
+
+    async def fetch_availability(
+        self, preferences: Dict[str, Any]
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """Return ``(slots, live)`` where ``live`` is False for stub data.
+
+        Callers that cache availability must skip stub slots, which are not
+        bookable on cal.com.
+        """
+
         LOGGER.info(
             "cal.com availability: use_stub=%s event_type_id=%s",
             self.use_stub,
@@ -55,39 +101,43 @@ class CalComAdapter:
         )
 
         if self.use_stub:
-            return self._stub_slots(preferences)
+            return self._stub_slots(preferences), False
 
         try:
             params = self._build_availability_params(preferences)
-            with self._http_client() as client:
-                response = client.get(self._availability_url, params=params)
-                response.raise_for_status()
-                payload = response.json()
-        except Exception as exc:  # pragma: no cover - defensive
+            client = self._http_client()
+            response = await client.get(self._availability_url, params=params)
+            response.raise_for_status()
+            payload = orjson.loads(response.content)
+        except Exception as exc:
             LOGGER.error("cal.com availability failed: %s", exc)
-            return self._stub_slots(preferences)
+            return self._stub_slots(preferences), False
 
         slots = self._coerce_slots(payload) or []
         if not slots:
-            return []
+            return [], True
 
         dentist_id = preferences.get("dentist_id")
         normalized: List[Dict[str, Any]] = []
+        append = normalized.append
         for item in slots:
+            # Key styles can differ between items, so resolve them per slot.
             start_time = (
                 item.get("startTime")
                 or item.get("start_time")
                 or item.get("start")
             )
+            if not start_time:
+                continue
             end_time = (
                 item.get("endTime")
                 or item.get("end_time")
                 or self._calculate_end_time(start_time)
             )
-            slot_id = item.get("uid") or item.get("id") or item.get("slot_id")
-            if not (start_time and end_time):
+            if not end_time:
                 continue
-            normalized.append(
+            slot_id = item.get("uid") or item.get("id") or item.get("slot_id")
+            append(
                 {
                     "slot_id": slot_id or f"{start_time}",
                     "start_time": start_time,
@@ -96,9 +146,9 @@ class CalComAdapter:
                 }
             )
 
-        return normalized
+        return normalized, True
 
-    def book_appointment(
+    async def book_appointment(
         self,
         *,
         slot: Dict[str, Any],
@@ -121,23 +171,21 @@ class CalComAdapter:
         payload = self._build_booking_payload(slot=slot, patient=patient)
 
         try:
-            with self._http_client() as client:
-                LOGGER.debug(
-                    "cal.com booking request: %s",
-                    json.dumps(payload, default=str),
-                )
-                response = client.post(
-                    "/bookings",
-                    params={"apiKey": self.api_key},
-                    json=payload,
-                )
-                response.raise_for_status()
-                LOGGER.debug(
-                    "cal.com booking response: %s %s",
-                    response.status_code,
-                    response.text,
-                )
-                booking_payload = response.json()
+            client = self._http_client()
+            body = orjson.dumps(payload, default=str)
+            LOGGER.debug("cal.com booking request: %s", body.decode())
+            response = await client.post(
+                "/bookings",
+                params={"apiKey": self.api_key},
+                content=body,
+            )
+            response.raise_for_status()
+            LOGGER.debug(
+                "cal.com booking response: %s %s",
+                response.status_code,
+                response.text,
+            )
+            booking_payload = orjson.loads(response.content)
         except httpx.HTTPStatusError as exc:  # pragma: no cover - defensive
             detail = exc.response.text if exc.response else ""
             LOGGER.error(
@@ -159,22 +207,21 @@ class CalComAdapter:
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
-    def _http_client(self) -> httpx.Client:
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-            "cal-api-version": "2024-09-04",
-        }
-        return httpx.Client(
+    def _http_client(self) -> httpx.AsyncClient:
+        if self._client is not None and not self._client.is_closed:
+            return self._client
+
+        self._client = httpx.AsyncClient(
             base_url=self.base_url,
-            headers=headers,
+            headers=self._base_headers,
             timeout=self._timeout,
+            limits=self._limits,
         )
+        return self._client
 
     def _build_availability_params(self, preferences: Dict[str, Any]) -> Dict[str, Any]:
         date_str = preferences.get("date")
-        tz = ZoneInfo(self.timezone)
+        tz = self._tz
 
         if date_str:
             try:
@@ -189,8 +236,8 @@ class CalComAdapter:
         start = target_date.replace(hour=0, minute=0, second=0, microsecond=0)
         end = start + timedelta(days=1)
 
-        start_utc = start.astimezone(ZoneInfo("UTC")).strftime("%Y-%m-%dT%H:%M:%SZ")
-        end_utc = end.astimezone(ZoneInfo("UTC")).strftime("%Y-%m-%dT%H:%M:%SZ")
+        start_utc = _utc_timestamp(start)
+        end_utc = _utc_timestamp(end)
 
         return {
             "eventTypeId": self.event_type_id,
@@ -223,8 +270,8 @@ class CalComAdapter:
             return None
 
         try:
-            normalized = start_time.replace("Z", "+00:00")
-            start_dt = datetime.fromisoformat(normalized)
+            # Python 3.11's fromisoformat accepts a trailing "Z" directly.
+            start_dt = datetime.fromisoformat(start_time)
         except ValueError:
             LOGGER.debug("Unable to parse slot start time: %s", start_time)
             return None
@@ -238,38 +285,38 @@ class CalComAdapter:
         slot: Dict[str, Any],
         patient: Dict[str, Any],
     ) -> Dict[str, Any]:
-        attendee = {
-            "name": patient.get("name") or patient.get("full_name", "Patient"),
-            "email": patient.get("email"),
-            "timeZone": self.timezone,
-            "language": "en",
-        }
-
-        metadata = {
-            "phone": patient.get("phone"),
-            "reason": patient.get("reason"),
-        }
-
-        responses: Dict[str, Any] = {}
-        patient_name = attendee["name"]
-        patient_email = attendee["email"]
+        patient_name = patient.get("name") or patient.get("full_name", "Patient")
+        patient_email = patient.get("email")
         patient_phone = patient.get("phone")
+        reason = patient.get("reason")
 
+        metadata: Dict[str, Any] = {}
+        responses: Dict[str, Any] = {}
         if patient_name:
             responses["name"] = patient_name
         if patient_email:
             responses["email"] = patient_email
         if patient_phone:
+            metadata["phone"] = patient_phone
             responses["phoneNumber"] = patient_phone
+        if reason:
+            metadata["reason"] = reason
 
+        start_time = slot.get("start_time")
+        end_time = slot.get("end_time")
         payload: Dict[str, Any] = {
             "eventTypeId": self.event_type_id,
-            "start": slot.get("start_time"),
-            "end": slot.get("end_time"),
-            "startTime": slot.get("start_time"),  # backwards compatibility
-            "endTime": slot.get("end_time"),
-            "attendees": [attendee],
-            "metadata": {k: v for k, v in metadata.items() if v} or {},
+            "start": start_time,
+            "end": end_time,
+            "attendees": [
+                {
+                    "name": patient_name,
+                    "email": patient_email,
+                    "timeZone": self.timezone,
+                    "language": "en",
+                }
+            ],
+            "metadata": metadata,
             "timeZone": self.timezone,
             "language": "en",
             "responses": responses,
@@ -305,20 +352,10 @@ class CalComAdapter:
         preferred_date = preferences.get("date") or datetime.now().date().isoformat()
         dentist_id = preferences.get("dentist_id", "dr_verma")
 
-        return [
-            {
-                "slot_id": f"{preferred_date}-18",
-                "start_time": f"{preferred_date}T18:00:00+05:30",
-                "end_time": f"{preferred_date}T18:30:00+05:30",
-                "dentist_id": dentist_id,
-            },
-            {
-                "slot_id": f"{preferred_date}-19",
-                "start_time": f"{preferred_date}T19:00:00+05:30",
-                "end_time": f"{preferred_date}T19:30:00+05:30",
-                "dentist_id": dentist_id,
-            },
-        ]
+        # The cached templates are keyed on hashable inputs only; the dentist
+        # id may be any extracted JSON value, so it is added to each copy.
+        templates = _stub_slot_templates(preferred_date, self._tz)
+        return [{**slot, "dentist_id": dentist_id} for slot in templates]
 
     def _stub_booking(
         self,
@@ -334,3 +371,41 @@ class CalComAdapter:
             "patient_name": patient.get("name"),
             "patient_phone": patient.get("phone"),
         }
+
+
+@lru_cache(maxsize=256)
+def _stub_slot_templates(
+    preferred_date: str,
+    tz: ZoneInfo,
+) -> Tuple[Dict[str, Any], ...]:
+    """Build the deterministic stub slots for a date, without a dentist id."""
+
+    templates = []
+    for hour in STUB_SLOT_HOURS:
+        # Resolve the offset on the slot's own date so DST zones stay right.
+        offset = _utc_offset(preferred_date, hour, tz)
+        templates.append(
+            {
+                "slot_id": f"{preferred_date}-{hour}",
+                "start_time": f"{preferred_date}T{hour}:00:00{offset}",
+                "end_time": f"{preferred_date}T{hour}:30:00{offset}",
+            }
+        )
+    return tuple(templates)
+
+
+def _utc_offset(preferred_date: str, hour: int, tz: ZoneInfo) -> str:
+    """Return the ``+HH:MM`` offset of ``tz`` at ``hour`` on ``preferred_date``."""
+
+    try:
+        moment = datetime.combine(date.fromisoformat(preferred_date), time(hour), tz)
+    except ValueError:
+        moment = datetime.now(tz)
+    return moment.isoformat(timespec="seconds")[-6:]
+
+
+def _utc_timestamp(value: datetime) -> str:
+    """Format an aware datetime as cal.com's ``YYYY-MM-DDTHH:MM:SSZ``."""
+
+    return value.astimezone(UTC).isoformat(timespec="seconds").replace("+00:00", "Z")
+
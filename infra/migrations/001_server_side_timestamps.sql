@@ -0,0 +1,17 @@
+-- Move ORM timestamp defaults to the database (see backend/models).
+ALTER TABLE appointments ALTER COLUMN created_at SET DEFAULT now();
+ALTER TABLE appointments ALTER COLUMN updated_at SET DEFAULT now();
+ALTER TABLE dentists ALTER COLUMN created_at SET DEFAULT now();
+ALTER TABLE patients ALTER COLUMN created_at SET DEFAULT now();
+
+CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+BEGIN
+    NEW.updated_at = now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS appointments_set_updated_at ON appointments;
+CREATE TRIGGER appointments_set_updated_at
+    BEFORE UPDATE ON appointments
+    FOR EACH ROW EXECUTE FUNCTION set_updated_at();
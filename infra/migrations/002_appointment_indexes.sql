@@ -0,0 +1,10 @@
+-- Indexes for dentist availability and patient upcoming-appointment lookups.
+CREATE INDEX IF NOT EXISTS ix_appt_dentist_start ON appointments (dentist_id, start_time);
+CREATE INDEX IF NOT EXISTS ix_appt_patient_start ON appointments (patient_id, start_time);
+CREATE INDEX IF NOT EXISTS ix_appt_status_start ON appointments (status, start_time);
+CREATE INDEX IF NOT EXISTS ix_appt_active ON appointments (dentist_id, start_time)
+    WHERE status IN ('PENDING', 'CONFIRMED');
+
+-- Background booking retries deduplicate on the cal.com identifier.
+ALTER TABLE appointments
+    ADD CONSTRAINT uq_appt_calcom_booking_id UNIQUE (calcom_booking_id);
@@ -0,0 +1,13 @@
+-- Store appointment status as a native enum instead of VARCHAR(32).
+CREATE TYPE appointment_status AS ENUM ('PENDING', 'CONFIRMED', 'CANCELLED', 'COMPLETED');
+
+-- Indexes that reference status are rebuilt against the new type.
+DROP INDEX IF EXISTS ix_appt_status_start;
+DROP INDEX IF EXISTS ix_appt_active;
+
+ALTER TABLE appointments
+    ALTER COLUMN status TYPE appointment_status USING status::appointment_status;
+
+CREATE INDEX IF NOT EXISTS ix_appt_status_start ON appointments (status, start_time);
+CREATE INDEX IF NOT EXISTS ix_appt_active ON appointments (dentist_id, start_time)
+    WHERE status IN ('PENDING', 'CONFIRMED');
@@ -0,0 +1,89 @@
+"""Shared fixtures for the HTTP-level tests."""
+
+import importlib
+from contextlib import ExitStack
+from functools import lru_cache
+from unittest import mock
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from tests.fakes import FakeCache
+
+# Update if the FastAPI app entry point moves.
+APP_IMPORT_PATH = "backend.main:app"
+
+
+@lru_cache(maxsize=None)
+def import_app():
+    """Import the FastAPI app once per process."""
+
+    module_name, app_name = APP_IMPORT_PATH.split(":")
+    module = importlib.import_module(module_name)
+    return getattr(module, app_name)
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    """Run async tests on asyncio with uvloop, matching the uvicorn server.
+
+    Session-scoped so async fixtures below can share one event loop.
+    """
+
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:  # pragma: no cover - uvloop is not built for Windows
+        return "asyncio"
+    return ("asyncio", {"use_uvloop": True})
+
+
+@pytest.fixture(scope="session")
+def app():
+    """The FastAPI application under test."""
+
+    return import_app()
+
+
+@pytest.fixture(scope="session")
+def asgi_transport(app) -> ASGITransport:
+    """ASGI transport into the app, built once per session.
+
+    ``ASGITransport`` skips the lifespan, so tests override the client
+    dependencies themselves.
+    """
+
+    return ASGITransport(app=app)
+
+
+@pytest.fixture(scope="session")
+async def client(asgi_transport):
+    """One AsyncClient shared by every request in the test session."""
+
+    async with AsyncClient(transport=asgi_transport, base_url="http://testserver") as ac:
+        yield ac
+
+
+@pytest.fixture(scope="session")
+def _fake_cache() -> FakeCache:
+    return FakeCache()
+
+
+@pytest.fixture
+def fake_cache(_fake_cache):
+    """Route the Redis helpers used by the app to an in-memory FakeCache.
+
+    One instance serves the whole session and is cleared before each test.
+    """
+
+    import backend.routers.chat as chat_router
+    import backend.services.actions as actions_mod
+    import backend.services.session as session_mod
+
+    _fake_cache.clear()
+    with ExitStack() as stack:
+        stack.enter_context(mock.patch.object(session_mod, "cache_pipeline", _fake_cache.pipeline))
+        stack.enter_context(mock.patch.object(chat_router, "cache_get", _fake_cache.cache_get))
+        stack.enter_context(mock.patch.object(actions_mod, "cache_set", _fake_cache.cache_set))
+        stack.enter_context(mock.patch.object(actions_mod, "cache_get", _fake_cache.cache_get))
+        stack.enter_context(mock.patch.object(actions_mod, "cache_delete", _fake_cache.cache_delete))
+        yield _fake_cache
@@ -0,0 +1,80 @@
+"""In-memory stand-ins for the Redis helpers in ``backend.services.cache``."""
+
+from typing import Any, Dict, List, Optional
+
+
+def _decode(value: Any) -> Any:
+    # Mirror decode_responses=True: bytes come back as str.
+    return value.decode() if isinstance(value, bytes) else value
+
+
+class FakeCache:
+    """Dict-backed replacement for the cache_* helpers and cache_pipeline."""
+
+    def __init__(self) -> None:
+        self.values: Dict[str, str] = {}
+        self.hashes: Dict[str, Dict[str, str]] = {}
+        self.lists: Dict[str, List[str]] = {}
+
+    def clear(self) -> None:
+        """Forget every stored key."""
+
+        self.values.clear()
+        self.hashes.clear()
+        self.lists.clear()
+
+    async def cache_set(self, key: str, value: Any, ex: Optional[int] = None) -> bool:
+        self.values[key] = _decode(value)
+        return True
+
+    async def cache_get(self, key: str) -> Optional[str]:
+        return self.values.get(key)
+
+    async def cache_delete(self, key: str) -> int:
+        return int(self.values.pop(key, None) is not None)
+
+    def pipeline(self, transaction: bool = False) -> "FakePipeline":
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Queue hash/list commands and apply them on ``execute``."""
+
+    def __init__(self, cache: FakeCache) -> None:
+        self._cache = cache
+        self._ops: List[Any] = []
+
+    def hgetall(self, key: str) -> None:
+        self._ops.append(lambda: dict(self._cache.hashes.get(key, {})))
+
+    def hset(self, key: str, mapping: Dict[str, str]) -> None:
+        self._ops.append(lambda: self._cache.hashes.setdefault(key, {}).update(mapping))
+
+    def lrange(self, key: str, start: int, end: int) -> None:
+        self._ops.append(lambda: list(self._cache.lists.get(key, [])))
+
+    def rpush(self, key: str, *values: Any) -> None:
+        decoded = [_decode(value) for value in values]
+        self._ops.append(lambda: self._cache.lists.setdefault(key, []).extend(decoded))
+
+    def ltrim(self, key: str, start: int, end: int) -> None:
+        def _ltrim() -> None:
+            lists = self._cache.lists
+            lists[key] = lists.get(key, [])[start : end + 1 or None]
+
+        self._ops.append(_ltrim)
+
+    def delete(self, *keys: str) -> None:
+        def _delete() -> None:
+            for key in keys:
+                self._cache.values.pop(key, None)
+                self._cache.hashes.pop(key, None)
+                self._cache.lists.pop(key, None)
+
+        self._ops.append(_delete)
+
+    def expire(self, key: str, seconds: int) -> None:
+        self._ops.append(lambda: True)
+
+    async def execute(self) -> List[Any]:
+        return [op() for op in self._ops]
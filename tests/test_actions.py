@@ -0,0 +1,77 @@
+"""Tests for chat action side-effects."""
+
+from typing import Any, Dict, List, Tuple
+
+import orjson
+import pytest
+from fastapi import BackgroundTasks
+
+from backend.services.actions import SLOTS_CACHE_PREFIX, execute_action
+from backend.services.session import new_session_state
+
+PREFERENCES = {"date": "2030-01-01", "time_window": "evening"}
+SLOT = {
+    "slot_id": "cal-1",
+    "start_time": "2030-01-01T18:00:00+05:30",
+    "end_time": "2030-01-01T18:30:00+05:30",
+    "dentist_id": None,
+}
+
+
+class CountingCalendar:
+    """Calendar fake that counts availability lookups."""
+
+    def __init__(self, live: bool = True) -> None:
+        self.live = live
+        self.calls = 0
+
+    async def fetch_availability(
+        self, preferences: Dict[str, Any]
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        self.calls += 1
+        return [dict(SLOT)], self.live
+
+
+async def check_availability(calendar: CountingCalendar) -> Dict[str, Any]:
+    state = new_session_state()
+    state["preferences"] = dict(PREFERENCES)
+    await execute_action(
+        action_type="CHECK_AVAILABILITY",
+        session_id="slots",
+        session_state=state,
+        action_payload={},
+        calendar_client=calendar,
+        background_tasks=BackgroundTasks(),
+    )
+    return state
+
+
+def cached_slot_keys(fake_cache) -> List[str]:
+    return [key for key in fake_cache.values if key.startswith(SLOTS_CACHE_PREFIX)]
+
+
+@pytest.mark.anyio
+async def test_availability_miss_then_hit(fake_cache) -> None:
+    """Live results are cached and served to the next lookup."""
+
+    calendar = CountingCalendar()
+    first = await check_availability(calendar)
+    second = await check_availability(calendar)
+
+    assert calendar.calls == 1
+    assert first["available_slots"] == second["available_slots"] == [SLOT]
+    (key,) = cached_slot_keys(fake_cache)
+    assert orjson.loads(fake_cache.values[key]) == [SLOT]
+
+
+@pytest.mark.anyio
+async def test_stub_fallback_is_not_cached(fake_cache) -> None:
+    """Fallback stub slots are returned but never shared through the cache."""
+
+    calendar = CountingCalendar(live=False)
+    state = await check_availability(calendar)
+    await check_availability(calendar)
+
+    assert state["available_slots"] == [SLOT]
+    assert calendar.calls == 2
+    assert cached_slot_keys(fake_cache) == []
@@ -0,0 +1,75 @@
+"""Query-count tests for appointment eager loading."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import Session
+
+from backend.models import Appointment, AppointmentStatus, Dentist, Patient
+from backend.models.base import Base
+from backend.services.appointments import dentist_schedule_query
+
+
+@pytest.fixture()
+def engine():
+    """In-memory database seeded with one dentist and five appointments."""
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    now = datetime.now(timezone.utc)
+    with Session(engine) as session:
+        dentist = Dentist(name="Dr Verma", clinic_name="Verma", calcom_calendar_id="cal")
+        for idx in range(5):
+            session.add(
+                Appointment(
+                    patient=Patient(name=f"Patient {idx}"),
+                    dentist=dentist,
+                    start_time=now + timedelta(hours=idx),
+                    end_time=now + timedelta(hours=idx, minutes=30),
+                    channel="slack",
+                )
+            )
+        session.commit()
+    return engine
+
+
+def test_schedule_query_avoids_n_plus_one(engine) -> None:
+    """Listing appointments should not issue one query per row."""
+
+    statements: list[str] = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    now = datetime.now(timezone.utc)
+    with Session(engine) as session:
+        rows = session.scalars(
+            dentist_schedule_query(1, now - timedelta(days=1), now + timedelta(days=1))
+        ).all()
+        names = [row.patient.name for row in rows]
+        clinics = {row.dentist.clinic_name for row in rows}
+
+    assert len(names) == 5
+    assert clinics == {"Verma"}
+    assert {row.status for row in rows} == {AppointmentStatus.PENDING}
+    assert len(statements) == 3
+
+
+def test_implicit_lazy_load_raises(engine) -> None:
+    """Relationships must be eager-loaded explicitly at query sites."""
+
+    with Session(engine) as session:
+        appointment = session.get(Appointment, 1)
+        with pytest.raises(InvalidRequestError):
+            appointment.patient
+
+
+def test_mapper_registry_has_single_definitions() -> None:
+    """Each ORM model should be mapped exactly once."""
+
+    mapped = sorted(mapper.class_.__name__ for mapper in Base.registry.mappers)
+    assert mapped == ["Appointment", "Dentist", "Patient"]
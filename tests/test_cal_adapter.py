@@ -0,0 +1,109 @@
+"""Tests for the cal.com adapter's stub path."""
+
+import httpx
+import pytest
+
+from calendar_service.cal_adapter import CalComAdapter
+
+
+def stub_adapter(timezone: str) -> CalComAdapter:
+    return CalComAdapter(api_key="", timezone=timezone, use_stub=True)
+
+
+def live_adapter(handler) -> CalComAdapter:
+    """Adapter in API mode whose HTTP calls are answered by ``handler``."""
+
+    adapter = CalComAdapter(api_key="key", event_type_id=1)
+    adapter._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return adapter
+
+
+@pytest.mark.parametrize(
+    ("preferred_date", "offset"),
+    [("2026-01-15", "-05:00"), ("2026-07-15", "-04:00")],
+)
+def test_stub_slots_use_offset_of_requested_date(preferred_date, offset) -> None:
+    """DST zones get the offset in effect on the requested date."""
+
+    slots = stub_adapter("America/New_York")._stub_slots({"date": preferred_date})
+
+    assert slots[0]["start_time"] == f"{preferred_date}T18:00:00{offset}"
+    assert slots[0]["end_time"] == f"{preferred_date}T18:30:00{offset}"
+
+
+@pytest.mark.parametrize("dentist_id", [["dr_verma"], {"id": 7}, 7, None])
+def test_stub_slots_accept_any_dentist_id(dentist_id) -> None:
+    """Extracted dentist ids of any JSON type come back unchanged."""
+
+    slots = stub_adapter("Asia/Kolkata")._stub_slots(
+        {"date": "2026-01-15", "dentist_id": dentist_id}
+    )
+
+    assert [slot["dentist_id"] for slot in slots] == [dentist_id, dentist_id]
+    assert slots[0]["start_time"] == "2026-01-15T18:00:00+05:30"
+
+
+@pytest.mark.anyio
+async def test_failed_availability_call_is_flagged_as_stub() -> None:
+    """API failures fall back to stub slots marked as not live."""
+
+    adapter = live_adapter(lambda request: httpx.Response(500))
+    slots, live = await adapter.fetch_availability({"date": "2030-01-01"})
+    await adapter.aclose()
+
+    assert live is False
+    assert slots == adapter._stub_slots({"date": "2030-01-01"})
+
+
+def slots_response(slots):
+    return lambda request: httpx.Response(200, json={"data": slots})
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("raw_slots", "expected"),
+    [
+        (
+            [{"uid": "a", "startTime": "2030-01-01T10:00:00Z", "endTime": "2030-01-01T10:45:00Z"}],
+            [("a", "2030-01-01T10:00:00Z", "2030-01-01T10:45:00Z")],
+        ),
+        (
+            [{"id": 7, "start": "2030-01-01T10:00:00+00:00"}],
+            [(7, "2030-01-01T10:00:00+00:00", "2030-01-01T10:30:00+00:00")],
+        ),
+        (
+            [{"start": "2030-01-01T10:00:00+00:00", "end_time": "2030-01-01T10:15:00+00:00"}],
+            [
+                (
+                    "2030-01-01T10:00:00+00:00",
+                    "2030-01-01T10:00:00+00:00",
+                    "2030-01-01T10:15:00+00:00",
+                )
+            ],
+        ),
+        (
+            [
+                {"start": "2030-01-01T10:00:00+00:00"},
+                {"uid": "b", "startTime": "2030-01-01T11:00:00+00:00", "endTime": "2030-01-01T11:30:00+00:00"},
+            ],
+            [
+                (
+                    "2030-01-01T10:00:00+00:00",
+                    "2030-01-01T10:00:00+00:00",
+                    "2030-01-01T10:30:00+00:00",
+                ),
+                ("b", "2030-01-01T11:00:00+00:00", "2030-01-01T11:30:00+00:00"),
+            ],
+        ),
+    ],
+    ids=["camel-case", "start-only", "no-id", "mixed-keys"],
+)
+async def test_availability_normalizes_each_slot(raw_slots, expected) -> None:
+    """Every slot is normalized from whichever key style it uses."""
+
+    adapter = live_adapter(slots_response(raw_slots))
+    slots, live = await adapter.fetch_availability({"date": "2030-01-01"})
+    await adapter.aclose()
+
+    assert live is True
+    assert [(s["slot_id"], s["start_time"], s["end_time"]) for s in slots] == expected
@@ -0,0 +1,127 @@
+"""Chat route tests against the rule-based stub LLM client."""
+
+from typing import Any, Dict
+
+import orjson
+import pytest
+from fastapi import BackgroundTasks
+
+from backend.routers.chat import ChatRequest, handle_chat_message
+from backend.services.actions import BOOKING_IN_PROGRESS, perform_booking
+from backend.services.llm import RAASLLMClient
+from backend.services.session import SessionBuffer
+
+SLOT = {"slot_id": "s1", "start_time": "2030-01-01T10:00:00+05:30"}
+PATIENT = {"name": "Jane Doe", "email": "jane@example.com"}
+
+
+class BookingCalendar:
+    @staticmethod
+    async def book_appointment(*, slot: Dict[str, Any], patient: Dict[str, Any]) -> Dict[str, Any]:
+        return {"calcom_booking_id": "cal_1", "status": "CONFIRMED", "start_time": slot["start_time"]}
+
+
+class FailingCalendar:
+    @staticmethod
+    async def book_appointment(*, slot: Dict[str, Any], patient: Dict[str, Any]) -> Dict[str, Any]:
+        raise RuntimeError("cal.com unavailable")
+
+
+async def send(session_id: str, message_text: str) -> Dict[str, Any]:
+    """Run one chat turn through the handler and return the response body."""
+
+    background_tasks = BackgroundTasks()
+    response = await handle_chat_message(
+        ChatRequest(
+            session_id=session_id,
+            channel="slack",
+            user_id="u1",
+            message_text=message_text,
+        ),
+        background_tasks,
+        llm_client=RAASLLMClient(api_key=None, model="test"),
+        calendar_client=None,
+    )
+    await background_tasks()
+    return orjson.loads(response.body)
+
+
+@pytest.mark.anyio
+async def test_repeated_message_follows_session_state(fake_cache) -> None:
+    """A repeated short message must be answered from the current state."""
+
+    first = await send("repeat", "ok")
+    await send("repeat", "Jane Doe, 9876543210 jane@example.com")
+    third = await send("repeat", "ok")
+
+    assert first["action"]["missing_fields"] == ["patient_email"]
+    assert "patient_email" not in third["action"].get("missing_fields", [])
+    assert third["reply_to_user"] != first["reply_to_user"]
+    history = fake_cache.lists["raas:session:{repeat}:history"]
+    assert len(history) == 6
+
+
+async def start_booking(session_id: str) -> None:
+    """Store a session whose booking was handed to a background task."""
+
+    session = await SessionBuffer.load(session_id)
+    session.state["metadata"]["booking_status"] = BOOKING_IN_PROGRESS
+    await session.flush()
+
+
+def stored_metadata(fake_cache, session_id: str) -> Dict[str, Any]:
+    return orjson.loads(fake_cache.hashes[f"raas:session:{{{session_id}}}"]["metadata"])
+
+
+@pytest.mark.anyio
+async def test_booking_result_is_merged_on_next_turn(fake_cache) -> None:
+    """The background task only stores its result; the next turn merges it."""
+
+    await start_booking("booked")
+    await perform_booking("booked", SLOT, PATIENT, BookingCalendar)
+
+    assert stored_metadata(fake_cache, "booked")["booking_status"] == BOOKING_IN_PROGRESS
+
+    await send("booked", "thanks")
+
+    metadata = stored_metadata(fake_cache, "booked")
+    assert "booking_status" not in metadata
+    assert metadata["latest_booking"]["calcom_booking_id"] == "cal_1"
+    assert orjson.loads(fake_cache.hashes["raas:session:{booked}"]["status"]) == "CONFIRMED"
+
+
+@pytest.mark.anyio
+async def test_failed_booking_is_reported(fake_cache) -> None:
+    """A raising calendar stores FAILED and the next turn flags the error."""
+
+    await start_booking("failed")
+    await perform_booking("failed", SLOT, PATIENT, FailingCalendar)
+
+    assert orjson.loads(fake_cache.values["booking:failed"]) == {"status": "FAILED"}
+
+    await send("failed", "thanks")
+
+    metadata = stored_metadata(fake_cache, "failed")
+    assert metadata["booking_error"] == "booking_failed"
+    assert "latest_booking" not in metadata
+
+
+@pytest.mark.anyio
+async def test_booking_poll_endpoint(fake_cache, client) -> None:
+    """The poll endpoint returns 404 until a booking result is stored."""
+
+    resp = await client.get("/chat/polled/booking")
+    assert resp.status_code == 404
+
+    await perform_booking("polled", SLOT, PATIENT, BookingCalendar)
+
+    resp = await client.get("/chat/polled/booking")
+    assert resp.status_code == 200
+    assert resp.json() == {
+        "session_id": "polled",
+        "booking": {
+            "calcom_booking_id": "cal_1",
+            "status": "CONFIRMED",
+            "start_time": SLOT["start_time"],
+        },
+    }
@@ -0,0 +1,58 @@
+"""Tests for the rule-based stub path of the LLM client."""
+
+import pytest
+
+from backend.services.llm import RAASLLMClient
+
+
+@pytest.fixture()
+def stub_client() -> RAASLLMClient:
+    return RAASLLMClient(api_key=None, model="test")
+
+
+@pytest.mark.parametrize(
+    ("message", "expected"),
+    [
+        (
+            "my name is john email john@example.com",
+            {"patient_name": "John Email John", "patient_email": "john@example.com"},
+        ),
+        (
+            "I am Priya and my email is priya@x.com",
+            {"patient_name": "Priya And My Email Is Priya", "patient_email": "priya@x.com"},
+        ),
+        (
+            "Jane Doe, 9876543210 jane@example.com",
+            {
+                "patient_name": "Jane Doe",
+                "patient_phone": "9876543210",
+                "patient_email": "jane@example.com",
+            },
+        ),
+        (
+            "call 9876543210 on 2026-11-20 evening",
+            {
+                "patient_phone": "9876543210",
+                "preferred_date": "2026-11-20",
+                "preferred_time_window": "evening",
+            },
+        ),
+        ("mob-9876543210", {"patient_phone": "9876543210"}),
+        ("tel:-9876543210", {"patient_phone": "9876543210"}),
+        ("id-12345678", {"patient_phone": "12345678"}),
+    ],
+)
+def test_extract_stub_fields(stub_client, message, expected) -> None:
+    """Each field is extracted independently of the others."""
+
+    assert stub_client._extract_stub_fields(message) == expected
+
+
+@pytest.mark.parametrize(
+    ("message", "expected"),
+    [("1", 0), ("2", 1), (" 2 ", 1), ("+2", None), ("-1", None), ("1_0", None), ("", None), ("two", None)],
+)
+def test_extract_slot_selection(message, expected) -> None:
+    """Only plain digit replies select a slot."""
+
+    assert RAASLLMClient._extract_slot_selection(message) == expected
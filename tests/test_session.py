@@ -0,0 +1,57 @@
+"""Tests for Redis-backed session state."""
+
+import pytest
+from fastapi import BackgroundTasks
+
+from backend.services.actions import BOOKING_IN_PROGRESS, book_selected_slot
+from backend.services.session import SessionBuffer, set_available_slots
+
+INT_ID_SLOTS = [
+    {"slot_id": 101, "start_time": "2030-01-01T10:00:00+05:30"},
+    {"slot_id": 102, "start_time": "2030-01-01T11:00:00+05:30"},
+]
+
+
+@pytest.mark.anyio
+async def test_integer_slot_ids_survive_flush_and_booking(fake_cache) -> None:
+    """Slots with integer ids must persist and stay bookable by id."""
+
+    session = await SessionBuffer.load("int-slots")
+    set_available_slots(session.state, INT_ID_SLOTS)
+    session.state["patient"]["email"] = "jane@example.com"
+    await session.flush()
+
+    reloaded = await SessionBuffer.load("int-slots")
+    background_tasks = BackgroundTasks()
+    status = book_selected_slot(
+        "int-slots",
+        reloaded.state,
+        {"slot_id": 102},
+        calendar_client=None,
+        background_tasks=background_tasks,
+    )
+
+    assert status == BOOKING_IN_PROGRESS
+    assert background_tasks.tasks[0].args[1] == INT_ID_SLOTS[1]
+
+
+@pytest.mark.anyio
+async def test_corrupt_session_is_deleted(fake_cache) -> None:
+    """A bad JSON field resets the session once instead of on every turn."""
+
+    fake_cache.hashes["raas:session:{corrupt}"] = {
+        "status": '"COLLECTING_INFO"',
+        "_slots_by_id": "{not json",
+    }
+    fake_cache.lists["raas:session:{corrupt}:history"] = ['{"role": "user"}']
+
+    session = await SessionBuffer.load("corrupt")
+    assert "_slots_by_id" not in session.state
+    assert "raas:session:{corrupt}" not in fake_cache.hashes
+    assert "raas:session:{corrupt}:history" not in fake_cache.lists
+
+    session.append_history("user", "hello")
+    await session.flush()
+
+    reloaded = await SessionBuffer.load("corrupt")
+    assert list(reloaded.state["history"]) == [{"role": "user", "content": "hello"}]
@@ -1,180 +1,215 @@
 # tests/test_conversation_flow.py
 #
-# Integration-style happy-path test for RAAS receptionist flow. The test:
-#   * Calls FastAPI app (backend.main:app) through httpx.AsyncClient.
-#   * Replaces Redis cache helpers with an in-memory dict.
-#   * Stubs RAASLLMClient.generate_response to emit a scripted sequence.
-#   * Stubs calendar_service adapter methods to avoid live API calls.
+# Integration-style happy-path test for RAAS receptionist flow. The tests:
+#   * Drive the four-turn conversation by awaiting the /chat handler directly,
+#     and send one turn through backend.main:app over httpx.AsyncClient.
+#   * Replace Redis cache helpers and session pipelines with tests.fakes.FakeCache.
+#   * Stub RAASLLMClient.generate_response to emit a scripted sequence.
+#   * Override the calendar client dependency to avoid live API calls.
 #
-# Update `import_path_app` if the FastAPI app entry point moves.
+# The shared `app` and `client` fixtures live in tests/conftest.py.
 
-import json
-from typing import Any, Dict, List
+from contextlib import ExitStack
+from datetime import date, timedelta
+from typing import Any, Dict, List, Tuple
+from unittest import mock
 
+import anyio
+import orjson
 import pytest
-from httpx import ASGITransport, AsyncClient
-
-# === CONFIGURE THESE to match your project ===
-import_path_app = "backend.main:app"
-
-
-# === helpers ===
-
-async def import_app():
-    module_name, app_name = import_path_app.split(":")
-    mod = __import__(module_name, fromlist=[app_name])
-    return getattr(mod, app_name)
-
-@pytest.mark.anyio
-async def test_conversation_happy_path(monkeypatch):
-    # import app
-    app = await import_app()
-
-    # monkeypatch in-memory cache for sessions to avoid Redis dependency
-    import backend.services.session as session_mod
-
-    cache_store: Dict[str, str] = {}
-
-    def fake_cache_set(key: str, value: str, ex: int | None = None) -> bool:
-        cache_store[key] = value
-        return True
-
-    def fake_cache_get(key: str) -> str | None:
-        return cache_store.get(key)
-
-    monkeypatch.setattr(session_mod, "cache_set", fake_cache_set)
-    monkeypatch.setattr(session_mod, "cache_get", fake_cache_get)
-
-    # monkeypatch LLM client generate_response with deterministic sequence
-    from backend.services.llm import LLMAction, LLMResponse, RAASLLMClient
-
-    responses: List[LLMResponse] = [
-        LLMResponse(
-            reply_to_user=(
-                "Hello — this is Dentist Verma’s reception. "
-                "May I have your full name and mobile number?"
-            ),
-            action=LLMAction(
-                type="COLLECT_INFO",
-                missing_fields=["patient_name", "patient_phone"],
-            ),
-            extracted={},
+from fastapi import BackgroundTasks
+
+from backend.routers.chat import (
+    ChatRequest,
+    get_calendar_client,
+    get_llm_client,
+    handle_chat_message,
+)
+from backend.services.llm import LLMAction, LLMResponse, RAASLLMClient
+
+# Session layer rejects past dates, so keep the scripted date in the future.
+PREFERRED_DATE = (date.today() + timedelta(days=30)).isoformat()
+
+# One user turn per scripted LLM response, in order:
+#   1) greeting, 2) name/phone/email/date, 3) ask for options, 4) pick option 1.
+MESSAGES = (
+    "Hi",
+    f"My name is Test User, phone 9999999999, email test.user@example.com, I want {PREFERRED_DATE} evening.",
+    "Please show options",
+    "1",
+)
+BASE_PAYLOAD = {"session_id": "s1", "channel": "slack", "user_id": "u1"}
+PAYLOADS = tuple(BASE_PAYLOAD | {"message_text": message} for message in MESSAGES)
+REQUESTS = tuple(ChatRequest.model_validate(payload) for payload in PAYLOADS)
+# Pre-encoded bodies for requests sent over HTTP.
+BODIES = tuple(orjson.dumps(payload) for payload in PAYLOADS)
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Built once at import; responses are never mutated, so tests share them.
+RESPONSES: Tuple[LLMResponse, ...] = (
+    LLMResponse(
+        reply_to_user=(
+            "Hello — this is Dentist Verma’s reception. "
+            "May I have your full name and mobile number?"
         ),
-        LLMResponse(
-            reply_to_user="Thanks. I will check available slots for 2025-11-15 in the evening.",
-            action=LLMAction(type="CHECK_AVAILABILITY"),
-            extracted={
-                "patient_name": "Test User",
-                "patient_phone": "9999999999",
-                "preferred_date": "2025-11-15",
-                "preferred_time_window": "evening",
-                "service_type": "consultation",
-            },
+        action=LLMAction(
+            type="COLLECT_INFO",
+            missing_fields=["patient_name", "patient_phone"],
         ),
-        LLMResponse(
-            reply_to_user=(
-                "I found two options: 1) 2025-11-15 18:00, 2) 2025-11-15 19:00. "
-                "Reply with the option number."
-            ),
-            action=LLMAction(type="AWAIT_SLOT_SELECTION"),
-            extracted={},
+        extracted={},
+    ),
+    LLMResponse(
+        reply_to_user=f"Thanks. I will check available slots for {PREFERRED_DATE} in the evening.",
+        action=LLMAction(type="CHECK_AVAILABILITY"),
+        extracted={
+            "patient_name": "Test User",
+            "patient_phone": "9999999999",
+            "patient_email": "test.user@example.com",
+            "preferred_date": PREFERRED_DATE,
+            "preferred_time_window": "evening",
+            "service_type": "consultation",
+        },
+    ),
+    LLMResponse(
+        reply_to_user=(
+            f"I found two options: 1) {PREFERRED_DATE} 18:00, 2) {PREFERRED_DATE} 19:00. "
+            "Reply with the option number."
         ),
-        LLMResponse(
-            reply_to_user=(
-                "Okay — sending your request to clinic. You’ll be notified when "
-                "doctor confirms."
-            ),
-            action=LLMAction(type="BOOK_SLOT", slot_index=0, notes="patient selected option 1"),
-            extracted={},
+        action=LLMAction(type="AWAIT_SLOT_SELECTION"),
+        extracted={},
+    ),
+    LLMResponse(
+        reply_to_user=(
+            "Okay — sending your request to clinic. You’ll be notified when "
+            "doctor confirms."
         ),
-    ]
-
-    call_index = {"value": 0}
-
-    def fake_generate_response(
-        self: RAASLLMClient,
-        *,
-        session: Dict[str, Any],
-        message_text: str,
-        channel: str,
-    ) -> LLMResponse:
-        idx = call_index["value"]
-        call_index["value"] = min(len(responses) - 1, idx + 1)
-        return responses[idx]
-
-    monkeypatch.setattr(
-        RAASLLMClient,
-        "generate_response",
-        fake_generate_response,
-    )
-
-    # monkeypatch calendar adapter used by chat router
-    import backend.routers.chat as chat_router
-
-    def fake_check_availability(preferences: Dict[str, Any]) -> List[Dict[str, Any]]:
-        return [
-            {
-                "slot_id": "s1",
-                "start_time": "2025-11-15T18:00:00+05:30",
-                "end_time": "2025-11-15T18:30:00+05:30",
-                "dentist_id": "d1",
-            },
-            {
-                "slot_id": "s2",
-                "start_time": "2025-11-15T19:00:00+05:30",
-                "end_time": "2025-11-15T19:30:00+05:30",
-                "dentist_id": "d1",
-            },
-        ]
-
-    def fake_book_appointment(*, slot: Dict[str, Any], patient: Dict[str, Any]) -> Dict[str, Any]:
-        return {
-            "calcom_booking_id": "cal_123",
-            "status": "PENDING",
+        action=LLMAction(type="BOOK_SLOT", slot_index=0, notes="patient selected option 1"),
+        extracted={},
+    ),
+)
+
+
+# === scripted LLM and calendar ===
+
+async def fake_generate_response(
+    self: RAASLLMClient,
+    *,
+    session: Dict[str, Any],
+    **_: Any,
+) -> LLMResponse:
+    """Reply with the scripted response for this session's turn.
+
+    The turn is read from the session's own history (the user message is
+    appended before the LLM call), so concurrent conversations do not share
+    a script position.
+    """
+
+    turn = len(session["history"]) // 2
+    return RESPONSES[min(turn, len(RESPONSES) - 1)]
+
+
+SLOTS: Tuple[Dict[str, Any], ...] = (
+    {
+        "slot_id": "s1",
+        "start_time": f"{PREFERRED_DATE}T18:00:00+05:30",
+        "end_time": f"{PREFERRED_DATE}T18:30:00+05:30",
+        "dentist_id": "d1",
+    },
+    {
+        "slot_id": "s2",
+        "start_time": f"{PREFERRED_DATE}T19:00:00+05:30",
+        "end_time": f"{PREFERRED_DATE}T19:30:00+05:30",
+        "dentist_id": "d1",
+    },
+)
+BOOKING_STUB = {"calcom_booking_id": "cal_123", "status": "PENDING"}
+
+
+class FakeCalendar:
+    @staticmethod
+    async def fetch_availability(
+        preferences: Dict[str, Any],
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        # The session keeps the returned list, so hand out a fresh one.
+        return list(SLOTS), True
+
+    @staticmethod
+    async def book_appointment(*, slot: Dict[str, Any], patient: Dict[str, Any]) -> Dict[str, Any]:
+        return BOOKING_STUB | {
             "start_time": slot["start_time"],
             "end_time": slot["end_time"],
             "patient_name": patient.get("name"),
         }
 
-    monkeypatch.setattr(chat_router, "calendar_client", chat_router.calendar_client)
-    monkeypatch.setattr(
-        chat_router.calendar_client,
-        "check_availability",
-        fake_check_availability,
-    )
-    monkeypatch.setattr(
-        chat_router.calendar_client,
-        "book_appointment",
-        fake_book_appointment,
-    )
-
-    transport = ASGITransport(app=app)
-
-    async with AsyncClient(transport=transport, base_url="http://testserver") as ac:
-        # Step 1: greeting
-        resp = await ac.post("/chat", json={"session_id": "s1", "channel": "slack", "user_id": "u1", "message_text": "Hi"})
-        assert resp.status_code == 200
-        body = resp.json()
-        assert "reply_to_user" in body
 
-        # Step 2: user supplies name & phone & date/time
-        resp = await ac.post("/chat", json={"session_id": "s1", "channel": "slack", "user_id": "u1", "message_text": "My name is Test User, phone 9999999999, I want 2025-11-15 evening."})
+# Dotted target -> replacement, applied together by the `patched` fixture.
+PATCHES = {
+    "backend.services.llm.RAASLLMClient.generate_response": fake_generate_response,
+}
+
+
+@pytest.fixture(scope="module")
+def patched(app):
+    """Apply PATCHES and the client overrides once for this module.
+
+    The fakes keep no per-test state, so nothing needs resetting between
+    tests; the in-memory Redis comes from the per-test ``fake_cache``.
+    """
+
+    # ASGITransport skips the lifespan, so provide the clients directly.
+    overrides = {
+        get_llm_client: lambda: RAASLLMClient(api_key=None, model="test"),
+        get_calendar_client: FakeCalendar,
+    }
+    with ExitStack() as stack:
+        for target, replacement in PATCHES.items():
+            stack.enter_context(mock.patch(target, replacement))
+        stack.enter_context(mock.patch.dict(app.dependency_overrides, overrides))
+        yield
+
+
+async def run_conversation(session_id: str, llm_client: RAASLLMClient) -> None:
+    """Play the scripted four-turn conversation for one session."""
+
+    # Each turn advances the scripted LLM and the stored session, so the
+    # requests must stay sequential.
+    for request, expected in zip(REQUESTS, RESPONSES, strict=True):
+        background_tasks = BackgroundTasks()
+        resp = await handle_chat_message(
+            request.model_copy(update={"session_id": session_id}),
+            background_tasks,
+            llm_client=llm_client,
+            calendar_client=FakeCalendar,
+        )
+        await background_tasks()
         assert resp.status_code == 200
-        body = resp.json()
-        assert "reply_to_user" in body
+        assert orjson.loads(resp.body)["reply_to_user"] == expected.reply_to_user
 
-        # Step 3: simulate backend added slots and LLM presents options
-        resp = await ac.post("/chat", json={"session_id": "s1", "channel": "slack", "user_id": "u1", "message_text": "Please show options"})
-        assert resp.status_code == 200
-        body = resp.json()
-        assert "reply_to_user" in body
 
-        # Step 4: user selects option 1
-        resp = await ac.post("/chat", json={"session_id": "s1", "channel": "slack", "user_id": "u1", "message_text": "1"})
-        assert resp.status_code == 200
-        body = resp.json()
-        assert "reply_to_user" in body
+@pytest.mark.anyio
+@pytest.mark.parametrize("conversations", [1, 4])
+async def test_conversation_happy_path(patched, fake_cache, conversations):
+    llm_client = RAASLLMClient(api_key=None, model="test")
+    session_ids = [f"s{idx}" for idx in range(1, conversations + 1)]
+
+    async with anyio.create_task_group() as tg:
+        for session_id in session_ids:
+            tg.start_soon(run_conversation, session_id, llm_client)
+
+    for session_id in session_ids:
+        # the background booking stores its result for polling; the session
+        # still shows it in progress until the next turn merges it
+        booking = orjson.loads(fake_cache.values[f"booking:{session_id}"])
+        assert booking["status"] == "PENDING"
+        key = f"raas:session:{{{session_id}}}"
+        stored_metadata = orjson.loads(fake_cache.hashes[key]["metadata"])
+        assert stored_metadata["booking_status"] == "booking_in_progress"
+        assert len(fake_cache.lists[f"{key}:history"]) == 8
+
 
-        # session metadata should include booking stub result
-        stored_state = json.loads(cache_store["raas:session:s1"])
-        assert stored_state["metadata"].get("latest_booking", {}).get("status") == "PENDING"
+@pytest.mark.anyio
+async def test_chat_endpoint_over_asgi(patched, fake_cache, client):
+    resp = await client.post("/chat", content=BODIES[0], headers=JSON_HEADERS)
+    assert resp.status_code == 200
+    assert resp.json()["reply_to_user"] == RESPONSES[0].reply_to_user
+    assert len(fake_cache.lists["raas:session:{s1}:history"]) == 2